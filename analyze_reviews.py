@@ -7,26 +7,88 @@ This script analyzes the scraped Zomato reviews and provides insights.
 
 import pandas as pd
 import json
+import sys
 import matplotlib.pyplot as plt
 import seaborn as sns
 from wordcloud import WordCloud
 import re
+import heapq
 from collections import Counter
 import numpy as np
 
+try:
+    import pyarrow
+    ARROW_STRINGS = True
+except ImportError:
+    ARROW_STRINGS = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+_NON_ALPHA_RE = re.compile(r'[^a-zA-Z\s]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_DASH_TO_SPACE = str.maketrans('-', ' ')
+
+# Sentiment keywords, looked up in the word counts built by sentiment_keywords
+POSITIVE_WORDS = ('good', 'great', 'excellent', 'amazing', 'delicious', 'tasty', 'awesome', 'wonderful', 'fantastic', 'perfect')
+NEGATIVE_WORDS = ('bad', 'poor', 'terrible', 'awful', 'disappointing', 'horrible', 'worst', 'pathetic', 'disgusting')
+
+def _json_default(value):
+    """Convert numpy scalars for the stdlib json fallback"""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _plot_histogram(values, bins, color):
+    """Bin values with numpy and draw the result as a bar chart"""
+    values = np.asarray(values, dtype=np.float64)
+    counts, edges = np.histogram(values[~np.isnan(values)], bins=bins)
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, color=color)
+
+def _show_plot():
+    """Show the current figure only when running interactively"""
+    if sys.stdout.isatty():
+        plt.show()
+    else:
+        plt.close()
+
 class ReviewAnalyzer:
     """Analyzer for scraped reviews"""
     
     def __init__(self, csv_file: str):
-        self.df = pd.read_csv(csv_file)
-        self.df['review_length'] = self.df['review'].str.len()
+        if ARROW_STRINGS:
+            # Arrow-backed strings keep text contiguous and run .str ops in C
+            self.df = pd.read_csv(csv_file, dtype={
+                'review': 'string[pyarrow]',
+                'restaurant_url': 'string[pyarrow]'
+            })
+            # Missing reviews stay NaN so they don't count as zero-length reviews
+            self.df['review_length'] = self.df['review'].str.len().astype(np.float64)
+        else:
+            self.df = pd.read_csv(csv_file)
+            
+            # Compute lengths straight off the object array to skip the .str accessor;
+            # missing reviews stay NaN so they don't count as zero-length reviews
+            reviews = self.df['review'].to_numpy(dtype=object, copy=False)
+            self.df['review_length'] = np.fromiter(
+                (len(r) if isinstance(r, str) else np.nan for r in reviews),
+                dtype=np.float64,
+                count=len(reviews)
+            )
+        
+        # Per-restaurant counts are reused by most reports
+        self._url_counts = self.df['restaurant_url'].value_counts()
+        self._n_unique = len(self._url_counts)
         
     def basic_statistics(self):
         """Generate basic statistics about the reviews"""
         print("=== Basic Statistics ===")
         print(f"Total reviews: {len(self.df)}")
-        print(f"Unique restaurants: {self.df['restaurant_url'].nunique()}")
-        print(f"Average reviews per restaurant: {len(self.df) / self.df['restaurant_url'].nunique():.2f}")
+        print(f"Unique restaurants: {self._n_unique}")
+        print(f"Average reviews per restaurant: {len(self.df) / self._n_unique:.2f}")
         print(f"Average review length: {self.df['review_length'].mean():.2f} characters")
         print(f"Median review length: {self.df['review_length'].median():.2f} characters")
         print()
@@ -34,9 +96,9 @@ class ReviewAnalyzer:
     def top_restaurants_by_reviews(self, n=10):
         """Show restaurants with most reviews"""
         print(f"=== Top {n} Restaurants by Review Count ===")
-        top_restaurants = self.df['restaurant_url'].value_counts().head(n)
+        top_restaurants = self._url_counts.head(n)
         for i, (url, count) in enumerate(top_restaurants.items(), 1):
-            restaurant_name = url.split('/')[-1].replace('-', ' ').title()
+            restaurant_name = url.rsplit('/', 1)[-1].translate(_DASH_TO_SPACE).title()
             print(f"{i}. {restaurant_name}: {count} reviews")
         print()
         
@@ -53,44 +115,38 @@ class ReviewAnalyzer:
         """Extract common positive and negative keywords"""
         print("=== Common Keywords Analysis ===")
         
-        # Combine all reviews
-        all_text = ' '.join(self.df['review'].astype(str).str.lower())
-        
-        # Remove common stop words and clean text
-        words = re.findall(r'\b[a-z]{3,}\b', all_text)
-        
-        # Common positive words
-        positive_words = ['good', 'great', 'excellent', 'amazing', 'delicious', 'tasty', 'awesome', 'wonderful', 'fantastic', 'perfect']
-        negative_words = ['bad', 'poor', 'terrible', 'awful', 'disappointing', 'horrible', 'worst', 'pathetic', 'disgusting']
-        
-        word_counts = Counter(words)
+        # Count words review by review instead of joining the whole corpus
+        word_counts = Counter()
+        for review in self.df['review'].to_numpy(dtype=object, copy=False):
+            if isinstance(review, str):
+                word_counts.update(_WORD_RE.findall(review.lower()))
         
         print("Top positive indicators:")
-        for word in positive_words:
+        for word in POSITIVE_WORDS:
             count = word_counts.get(word, 0)
             if count > 0:
                 print(f"  {word}: {count} mentions")
         
         print("\nTop negative indicators:")
-        for word in negative_words:
+        for word in NEGATIVE_WORDS:
             count = word_counts.get(word, 0)
             if count > 0:
                 print(f"  {word}: {count} mentions")
         
         print(f"\nMost common words overall:")
-        for word, count in word_counts.most_common(20):
-            if len(word) > 3:  # Skip very short words
-                print(f"  {word}: {count}")
+        # Skip very short words before picking the top 20 instead of sorting everything
+        candidates = ((word, count) for word, count in word_counts.items() if len(word) > 3)
+        for word, count in heapq.nlargest(20, candidates, key=lambda item: item[1]):
+            print(f"  {word}: {count}")
         print()
         
     def generate_wordcloud(self, output_file='wordcloud.png'):
         """Generate a word cloud from reviews"""
         try:
-            all_text = ' '.join(self.df['review'].astype(str))
+            all_text = ' '.join(self.df['review'].dropna().astype(str))
             
             # Clean text
-            all_text = re.sub(r'[^a-zA-Z\s]', '', all_text)
-            all_text = re.sub(r'\s+', ' ', all_text)
+            all_text = _WHITESPACE_RE.sub(' ', _NON_ALPHA_RE.sub('', all_text))
             
             wordcloud = WordCloud(
                 width=800, 
@@ -106,7 +162,7 @@ class ReviewAnalyzer:
             plt.title('Most Common Words in Reviews')
             plt.tight_layout()
             plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            plt.show()
+            _show_plot()
             
             print(f"Word cloud saved as {output_file}")
             
@@ -122,15 +178,15 @@ class ReviewAnalyzer:
             
             # Reviews per restaurant
             plt.subplot(2, 2, 1)
-            restaurant_counts = self.df['restaurant_url'].value_counts()
-            plt.hist(restaurant_counts, bins=20, alpha=0.7, color='skyblue')
+            restaurant_counts = self._url_counts
+            _plot_histogram(restaurant_counts, bins=20, color='skyblue')
             plt.title('Distribution of Reviews per Restaurant')
             plt.xlabel('Number of Reviews')
             plt.ylabel('Number of Restaurants')
             
             # Review length distribution
             plt.subplot(2, 2, 2)
-            plt.hist(self.df['review_length'], bins=30, alpha=0.7, color='lightgreen')
+            _plot_histogram(self.df['review_length'], bins=30, color='lightgreen')
             plt.title('Distribution of Review Lengths')
             plt.xlabel('Review Length (characters)')
             plt.ylabel('Number of Reviews')
@@ -147,14 +203,16 @@ class ReviewAnalyzer:
             # Review length vs page
             plt.subplot(2, 2, 4)
             if 'page' in self.df.columns:
-                plt.boxplot([self.df[self.df['page'] == page]['review_length'] for page in sorted(self.df['page'].unique())])
+                # One groupby pass instead of masking the frame once per page
+                lengths_by_page = [group.dropna().to_numpy() for _, group in self.df.groupby('page', sort=True)['review_length']]
+                plt.boxplot(lengths_by_page)
                 plt.title('Review Length by Page')
                 plt.xlabel('Page Number')
                 plt.ylabel('Review Length (characters)')
             
             plt.tight_layout()
             plt.savefig('review_analysis.png', dpi=300, bbox_inches='tight')
-            plt.show()
+            _show_plot()
             
             print("Analysis plots saved as review_analysis.png")
             
@@ -167,25 +225,30 @@ class ReviewAnalyzer:
         """Export a summary report"""
         report = {
             'total_reviews': len(self.df),
-            'unique_restaurants': self.df['restaurant_url'].nunique(),
-            'avg_reviews_per_restaurant': len(self.df) / self.df['restaurant_url'].nunique(),
+            'unique_restaurants': self._n_unique,
+            'avg_reviews_per_restaurant': len(self.df) / self._n_unique,
             'avg_review_length': self.df['review_length'].mean(),
             'median_review_length': self.df['review_length'].median(),
             'min_review_length': self.df['review_length'].min(),
             'max_review_length': self.df['review_length'].max(),
-            'top_restaurants': self.df['restaurant_url'].value_counts().head(10).to_dict(),
+            'top_restaurants': self._url_counts.head(10).to_dict(),
             'generated_at': pd.Timestamp.now().isoformat()
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    report,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(report, f, indent=2, default=_json_default)
         
         print(f"Summary report exported to {output_file}")
 
 def main():
     """Main analysis function"""
-    import sys
-    
     csv_file = 'zomato_reviews_from_urls.csv'
     
     if len(sys.argv) > 1:
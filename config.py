@@ -12,6 +12,7 @@ DELAY_RANGE = (1, 3)  # Random delay between requests (min, max seconds)
 MAX_RETRIES = 3  # Maximum retries for failed requests
 TIMEOUT = 30  # Request timeout in seconds
 CHUNK_SIZE = 10  # Save progress every N restaurants
+CONCURRENCY = 4  # Number of restaurants scraped in parallel
 
 # Headers to avoid blocking
 HEADERS = {
@@ -3,11 +3,15 @@
 Debug script to test review extraction selectors
 """
 
+import re
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 from config import REVIEW_SELECTORS, HEADERS
 
+# Only build nodes whose class could match a review selector or container probe
+REVIEW_STRAINER = SoupStrainer(class_=re.compile('review|comment|content|hreYiP'))
+
 def debug_review_extraction(url):
     """Debug review extraction for a specific URL"""
     print(f"Testing URL: {url}")
@@ -33,8 +37,10 @@ def debug_review_extraction(url):
         
         print(f"✅ Successfully fetched URL (status: {response.status_code})")
         
-        # Parse HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Parse HTML bytes with lxml and let it detect the encoding; selectors
+        # that need other attributes fall back to a full parse below
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=REVIEW_STRAINER)
+        full_soup = None
         
         print(f"\nTesting {len(REVIEW_SELECTORS)} selectors:")
         print("-" * 50)
@@ -45,6 +51,10 @@ def debug_review_extraction(url):
             
             try:
                 elements = soup.select(selector)
+                if not elements:
+                    if full_soup is None:
+                        full_soup = BeautifulSoup(response.content, 'lxml')
+                    elements = full_soup.select(selector)
                 print(f"   Found {len(elements)} elements")
                 
                 if elements:
@@ -16,16 +16,23 @@ Features:
 
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml.cssselect import CSSSelector
 import time
 import logging
+import logging.handlers
+import atexit
+import queue
 import os
+import re
+import html
 import sys
 from datetime import datetime
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import random
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Tuple
 
 # Import local modules
 try:
@@ -36,17 +43,40 @@ except ImportError as e:
     print("Make sure config.py and utils.py are in the same directory")
     sys.exit(1)
 
-# Configure logging
+# Configure logging; records are written by a background thread so worker
+# threads never wait on the log file
+log_handlers = [
+    logging.FileHandler(LOG_FILE, delay=True),
+    logging.StreamHandler()
+]
+for handler in log_handlers:
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+log_queue = queue.Queue()
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',  # Final formatting happens in log_handlers
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Compile the fallback selectors once instead of re-parsing them for every page
+COMPILED_SELECTORS = [CSSSelector(selector) for selector in REVIEW_SELECTORS]
+
+# Raw-bytes match for plain-text blocks of the primary selector (hreYiP paragraphs),
+# used once a restaurant's pages are known to use that layout. Every <p> tag that
+# mentions hreYiP must be a plain-text block carrying all of FAST_REVIEW_CLASSES,
+# otherwise the page goes through the full parser.
+FAST_REVIEW_CLASSES = {b'sc-1hez2tp-0', b'sc-hfLElm', b'hreYiP'}
+FAST_REVIEW_RE = re.compile(rb'<[pP]\b([^>]*\bhreYiP\b[^>]*)>([^<]*)</[pP]\s*>')
+FAST_BLOCK_START_RE = re.compile(rb'<[pP]\b[^>]*\bhreYiP\b')
+FAST_CLASS_ATTR_RE = re.compile(rb'(?:^|\s)class\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))', re.IGNORECASE)
+
+# Intermediate results are appended here as scraping progresses
+TEMP_FILE = f"temp_{OUTPUT_FILE}"
+
 class ZomatoReviewScraper:
     """Main scraper class for Zomato reviews"""
     
@@ -63,45 +93,67 @@ class ZomatoReviewScraper:
             backoff_factor=RETRY_BACKOFF_FACTOR,
             status_forcelist=RETRY_STATUS_CODES,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # One pooled connection per worker so parallel scrapes reuse connections
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=CONCURRENCY,
+            pool_maxsize=CONCURRENCY
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         session.headers.update(HEADERS)
         return session
     
     def _get_review_url(self, restaurant_url: str) -> str:
-        """Convert restaurant URL to review URL"""
-        if restaurant_url.endswith('/'):
-            restaurant_url = restaurant_url[:-1]
+        """Convert a restaurant URL without trailing slash to its review URL"""
         return restaurant_url + "/reviews"
     
-    def _extract_reviews(self, soup: BeautifulSoup) -> List[str]:
-        """Extract reviews using multiple CSS selectors as fallback"""
-        reviews = []
+    def _extract_reviews(self, tree: lxml.html.HtmlElement) -> Tuple[List[str], int]:
+        """Extract reviews using multiple CSS selectors as fallback
         
-        for selector in REVIEW_SELECTORS:
-            try:
-                review_blocks = soup.select(selector)
+        Returns the reviews and the index of the selector that matched, or -1.
+        """
+        for index, selector in enumerate(COMPILED_SELECTORS):
+            review_blocks = selector(tree)
+            
+            if review_blocks:
+                reviews = []
+                for block in review_blocks:
+                    text = block.text_content().strip()
+                    if text and len(text) > MIN_REVIEW_LENGTH:
+                        reviews.append(text)
                 
-                if review_blocks:
-                    for block in review_blocks:
-                        text = block.get_text(strip=True)
-                        if text and len(text) > MIN_REVIEW_LENGTH:
-                            reviews.append(text)
-                    
-                    logger.info(f"Found {len(review_blocks)} reviews using selector: {selector}")
-                    break
-                    
-            except Exception as e:
-                logger.warning(f"Error with selector {selector}: {e}")
-                continue
+                logger.debug("Found %d reviews using selector: %s", len(review_blocks), selector.css)
+                return reviews, index
+        
+        return [], -1
+    
+    def _extract_reviews_fast(self, content: bytes) -> List[str]:
+        """Extract primary-selector reviews straight from the page bytes"""
+        matches = FAST_REVIEW_RE.findall(content)
         
+        # Blocks with nested markup need the full parser, so give up on the whole page
+        if len(matches) != len(FAST_BLOCK_START_RE.findall(content)):
+            return []
+        
+        reviews = []
+        for attrs, match in matches:
+            # Same test as the primary selector: all three class tokens present
+            class_attr = FAST_CLASS_ATTR_RE.search(attrs)
+            if not class_attr or not FAST_REVIEW_CLASSES.issubset(b''.join(class_attr.groups(b'')).split()):
+                return []
+            
+            text = html.unescape(match.decode('utf-8', 'replace')).strip()
+            if len(text) > MIN_REVIEW_LENGTH:
+                reviews.append(text)
         return reviews
     
     def _scrape_restaurant_reviews(self, restaurant_url: str) -> List[Dict[str, Any]]:
         """Scrape reviews for a single restaurant"""
         review_url = self._get_review_url(restaurant_url)
         restaurant_reviews = []
+        # Set once the primary selector matches so later pages can skip tree building
+        use_fast_path = False
         
         try:
             for page in range(1, MAX_PAGES + 1):
@@ -118,23 +170,31 @@ class ZomatoReviewScraper:
                         logger.warning(f"Failed to fetch {full_url}, status code: {response.status_code}")
                         break
                     
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    page_reviews = self._extract_reviews(soup)
+                    page_reviews = []
+                    if use_fast_path:
+                        page_reviews = self._extract_reviews_fast(response.content)
                     
+                    # Fall back to the full parse when the fast path finds nothing
                     if not page_reviews:
-                        logger.info(f"No reviews found on page {page} for {restaurant_url}")
+                        tree = lxml.html.fromstring(response.content)
+                        page_reviews, selector_index = self._extract_reviews(tree)
+                        use_fast_path = selector_index == 0
+                    
+                    if not page_reviews:
+                        logger.debug("No reviews found on page %d for %s", page, restaurant_url)
                         break
                     
-                    # Add reviews with metadata
+                    # Add reviews with metadata; one timestamp covers the whole page
+                    scraped_at = datetime.now().isoformat()
                     for review_text in page_reviews:
                         restaurant_reviews.append({
                             'restaurant_url': restaurant_url,
                             'page': page,
                             'review': review_text,
-                            'scraped_at': datetime.now().isoformat()
+                            'scraped_at': scraped_at
                         })
                     
-                    logger.info(f"Extracted {len(page_reviews)} reviews from page {page}")
+                    logger.debug("Extracted %d reviews from page %d of %s", len(page_reviews), page, restaurant_url)
                     
                 except requests.exceptions.Timeout:
                     logger.error(f"Timeout for {full_url}")
@@ -151,43 +211,73 @@ class ZomatoReviewScraper:
         
         return restaurant_reviews
     
-    def scrape_all_reviews(self, urls: List[str]) -> List[Dict[str, Any]]:
-        """Scrape reviews from all restaurant URLs"""
-        all_reviews = []
+    def _flush_progress(self, reviews: List[Dict[str, Any]], urls: List[str]) -> None:
+        """Append a batch of reviews to the temp file, then record their URLs as done"""
+        if reviews:
+            pd.DataFrame(reviews).to_csv(TEMP_FILE, mode='a', header=not os.path.exists(TEMP_FILE), index=False)
+        
+        # URLs are logged after their reviews so a crash never skips unsaved work
+        if urls:
+            self.checkpoint_manager.mark_processed(urls)
+    
+    def scrape_all_reviews(self, urls: List[str]) -> int:
+        """Scrape reviews from all restaurant URLs into the temp file, returning the count"""
+        total_reviews = 0
+        unsaved_reviews = []
+        unsaved_urls = []
         processed_urls = self.checkpoint_manager.load_checkpoint()
+        last_processed = None
         
-        logger.info(f"Starting to scrape {len(urls)} restaurants")
+        # Intermediate results are appended, so drop leftovers from an unrelated run
+        if not processed_urls and os.path.exists(TEMP_FILE):
+            os.remove(TEMP_FILE)
         
-        for i, res_url in enumerate(urls):
-            # Skip if already processed
-            if res_url in processed_urls:
-                logger.info(f"Skipping already processed URL: {res_url}")
-                continue
-            
-            logger.info(f"Processing {i+1}/{len(urls)}: {res_url}")
-            
-            # Scrape restaurant reviews
-            restaurant_reviews = self._scrape_restaurant_reviews(res_url)
-            all_reviews.extend(restaurant_reviews)
-            processed_urls.append(res_url)
-            
-            logger.info(f"Completed {res_url}: {len(restaurant_reviews)} reviews collected")
+        # Normalize once so the same restaurant is never scraped twice
+        urls = list(dict.fromkeys(url.rstrip('/') for url in urls))
+        pending = [res_url for res_url in urls if res_url not in processed_urls]
+        
+        logger.info(f"{len(urls) - len(pending)} restaurants already done, {len(pending)} remaining")
+        logger.info(f"Starting to scrape {len(pending)} restaurants with {CONCURRENCY} workers")
+        
+        # Scrape several restaurants at once; pages of one restaurant stay sequential
+        # so scraping can stop at the first empty page
+        with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+            futures = {
+                executor.submit(self._scrape_restaurant_reviews, res_url): res_url
+                for res_url in pending
+            }
             
-            # Save checkpoint periodically
-            if (i + 1) % CHUNK_SIZE == 0:
-                self.checkpoint_manager.save_checkpoint(processed_urls, all_reviews)
-                
-                # Save intermediate results
-                if all_reviews:
-                    temp_df = pd.DataFrame(all_reviews)
-                    temp_file = f"temp_{OUTPUT_FILE}"
-                    temp_df.to_csv(temp_file, index=False)
-                    logger.info(f"Saved intermediate results: {len(all_reviews)} reviews")
+            try:
+                for completed, future in enumerate(as_completed(futures), 1):
+                    res_url = futures[future]
+                    restaurant_reviews = future.result()
+                    total_reviews += len(restaurant_reviews)
+                    unsaved_reviews.extend(restaurant_reviews)
+                    unsaved_urls.append(res_url)
+                    processed_urls.add(res_url)
+                    last_processed = res_url
+                    
+                    logger.info(f"Completed {completed}/{len(futures)} {res_url}: {len(restaurant_reviews)} reviews collected")
+                    
+                    # Save progress periodically; only the new batch is written
+                    if completed % CHUNK_SIZE == 0:
+                        self._flush_progress(unsaved_reviews, unsaved_urls)
+                        logger.info(f"Saved intermediate results: {len(unsaved_reviews)} new reviews, {total_reviews} total")
+                        unsaved_reviews = []
+                        unsaved_urls = []
+            except BaseException:
+                # On Ctrl-C (or any error) drop the queued restaurants instead of letting
+                # the pool scrape them, and keep what was already collected
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._flush_progress(unsaved_reviews, unsaved_urls)
+                logger.warning(f"Scraping interrupted after {len(processed_urls)} restaurants; rerun to resume")
+                raise
         
         # Final checkpoint save
-        self.checkpoint_manager.save_checkpoint(processed_urls, all_reviews)
+        self._flush_progress(unsaved_reviews, unsaved_urls)
+        self.checkpoint_manager.save_checkpoint(processed_urls, total_reviews, last_processed)
         
-        return all_reviews
+        return total_reviews
     
     def run(self):
         """Main execution method"""
@@ -195,24 +285,29 @@ class ZomatoReviewScraper:
         
         # Read input CSV
         try:
-            df = pd.read_csv(INPUT_FILE)
-            urls = df['url'].dropna().unique().tolist()
+            # Only the url column is needed, so skip parsing the rest
+            df = pd.read_csv(INPUT_FILE, usecols=['url'])
+            # Count restaurants, not spellings: trailing slashes are dropped first
+            urls = list(dict.fromkeys(url.rstrip('/') for url in df['url'].dropna()))
             logger.info(f"Successfully loaded {len(urls)} unique URLs from {INPUT_FILE}")
         except Exception as e:
             logger.error(f"Error reading CSV file: {e}")
             return
         
-        # Scrape all reviews
-        all_reviews = self.scrape_all_reviews(urls)
+        # Scrape all reviews; they are streamed to the temp file as they arrive
+        self.scrape_all_reviews(urls)
         
-        if not all_reviews:
+        if not os.path.exists(TEMP_FILE):
             logger.warning("No reviews were collected!")
             return
         
-        # Process and validate data
+        # Includes reviews saved by earlier, interrupted runs; each restaurant URL
+        # repeats for all of its reviews, so store it once as a category
+        all_reviews = pd.read_csv(TEMP_FILE, dtype={'review': str, 'restaurant_url': 'category'})
+        
+        # Process and validate data; the reviews stay a DataFrame from here on
         logger.info("Processing and validating scraped data...")
-        all_reviews = self.data_processor.validate_reviews(all_reviews, MIN_REVIEW_LENGTH)
-        all_reviews = self.data_processor.deduplicate_reviews(all_reviews)
+        all_reviews = self.data_processor.process_reviews(all_reviews, MIN_REVIEW_LENGTH)
         
         # Save final results
         self.data_processor.save_processed_data(all_reviews, OUTPUT_FILE)
@@ -232,9 +327,8 @@ class ZomatoReviewScraper:
         """)
         
         # Clean up temporary files
-        temp_file = f"temp_{OUTPUT_FILE}"
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
+        if os.path.exists(TEMP_FILE):
+            os.remove(TEMP_FILE)
             logger.info("Cleaned up temporary files")
 
 def main():
@@ -1,8 +1,16 @@
 import json
-import re
 from bs4 import BeautifulSoup
 import requests
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+PRELOADED_STATE_MARKER = 'window.__PRELOADED_STATE__'
+JSON_PARSE_PREFIX = 'JSON.parse("'
 
 class ZomatoJSParser:
     """Parser for extracting review data from Zomato's JavaScript payload"""
@@ -18,25 +26,56 @@ class ZomatoJSParser:
             'Upgrade-Insecure-Requests': '1'
         })
     
+    @staticmethod
+    def _find_string_end(text: str, start: int) -> int:
+        """Return the index of the quote closing the string literal that begins at start"""
+        pos = start
+        while True:
+            pos = text.find('"', pos)
+            if pos == -1:
+                return -1
+            
+            # A quote is escaped if it follows an odd number of backslashes
+            backslashes = 0
+            while text[pos - 1 - backslashes] == '\\':
+                backslashes += 1
+            if backslashes % 2 == 0:
+                return pos
+            pos += 1
+    
+    def _extract_preloaded_state(self, html_content: str) -> Optional[str]:
+        """Return the raw JSON.parse string literal assigned to __PRELOADED_STATE__"""
+        marker = html_content.find(PRELOADED_STATE_MARKER)
+        if marker == -1:
+            return None
+        
+        start = html_content.find(JSON_PARSE_PREFIX, marker)
+        if start == -1:
+            return None
+        start += len(JSON_PARSE_PREFIX)
+        
+        end = self._find_string_end(html_content, start)
+        if end == -1:
+            return None
+        
+        return html_content[start:end]
+    
     def extract_reviews_from_js(self, html_content: str) -> List[Dict[str, Any]]:
         """Extract review data from JavaScript payload in HTML"""
         try:
             # Find the JavaScript containing the review data
-            js_pattern = r'window\.__PRELOADED_STATE__\s*=\s*JSON\.parse\("([^"]+)"\);'
-            match = re.search(js_pattern, html_content, re.DOTALL)
+            js_literal = self._extract_preloaded_state(html_content)
             
-            if not match:
+            if js_literal is None:
                 print("No JavaScript state found")
                 return []
             
-            # Get the JSON string and unescape it
-            js_data = match.group(1)
-            # Unescape the JSON string
-            js_data = js_data.replace('\\"', '"').replace('\\\\', '\\')
-            
             # Parse the JSON data
             try:
-                data = json.loads(js_data)
+                # The literal uses JSON string escapes, so decoding it as a
+                # JSON string unescapes it in a single pass
+                js_data = _json_loads('"' + js_literal + '"')
+                data = _json_loads(js_data)
             except json.JSONDecodeError as e:
                 print(f"JSON decode error: {e}")
                 return []
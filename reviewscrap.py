@@ -1,24 +1,46 @@
 import pandas as pd
+import csv
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml.cssselect import CSSSelector
 import time
 import logging
+import logging.handlers
+import atexit
+import queue
 import json
 import os
+import hashlib
+import threading
 from datetime import datetime
+from urllib.parse import urlsplit
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-import random
+from urllib3.util.request import ACCEPT_ENCODING
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Configure logging
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configure logging; records are written by a background thread so worker
+# threads never wait on the log file
+log_handlers = [
+    logging.FileHandler('zomato_scraper.log', delay=True),
+    logging.StreamHandler()
+]
+for handler in log_handlers:
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+log_queue = queue.Queue()
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('zomato_scraper.log'),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',  # Final formatting happens in log_handlers
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Configuration
@@ -27,10 +49,19 @@ CONFIG = {
     'output_file': 'zomato_reviews_from_urls.csv',
     'checkpoint_file': 'scraping_checkpoint.json',
     'max_pages': 5,  # Increased from 3
-    'delay_range': (1, 3),  # Random delay between requests
+    'requests_per_second': 5,  # Per-host request rate ceiling, shared by all workers
+    'burst': 10,  # Requests allowed back to back before pacing kicks in
+    'min_requests_per_second': 0.1,  # Floor for the rate after repeated 429s
+    'rate_increase_after': 20,  # Successful fetches before the rate is raised again
     'max_retries': 3,
+    'rate_limit_wait': 60,  # Seconds to pause after a 429 without Retry-After
     'timeout': 30,
-    'chunk_size': 10  # Save progress every 10 restaurants
+    'chunk_size': 10,  # Save progress every 10 restaurants
+    'concurrency': 4,  # Restaurants scraped in parallel
+    'trust_env': False,  # Set True to pick up proxy settings from the environment
+    'cache_dir': 'html_cache',  # Fetched pages are kept here between runs
+    'cache_ttl': 7 * 24 * 3600,  # Seconds before a cached page is fetched again
+    'cache_size_limit': 10 * 2**30  # Bytes; oldest pages are evicted beyond this
 }
 
 # Enhanced headers to avoid blocking
@@ -38,146 +69,323 @@ HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     'Accept-Language': 'en-US,en;q=0.5',
-    'Accept-Encoding': 'gzip, deflate',
+    'Accept-Encoding': ACCEPT_ENCODING,  # Adds br/zstd when urllib3 can decode them
     'Connection': 'keep-alive',
     'Upgrade-Insecure-Requests': '1',
 }
 
-# STEP 1: Read CSV with error handling
-try:
-    df = pd.read_csv(CONFIG['input_file'])
-    urls = df['url'].dropna().unique().tolist()
-    logger.info(f"Successfully loaded {len(urls)} unique URLs from {CONFIG['input_file']}")
-except Exception as e:
-    logger.error(f"Error reading CSV file: {e}")
-    raise
-
 # STEP 2: Enhanced URL processing function
 def get_review_url(restaurant_url):
-    """Convert restaurant URL to review URL"""
-    if restaurant_url.endswith('/'):
-        restaurant_url = restaurant_url[:-1]
+    """Convert a restaurant URL (already stripped of its trailing slash) to its review URL"""
     return restaurant_url + "/reviews"
 
+def get_page_urls(restaurant_url):
+    """All review page URLs of a restaurant, built once up front"""
+    review_url = get_review_url(restaurant_url)
+    return [f"{review_url}?page={page}" for page in range(1, CONFIG['max_pages'] + 1)]
+
 # STEP 3: Setup session with retry strategy
 def create_session():
     """Create a requests session with retry strategy"""
     session = requests.Session()
+    # Exponential backoff with jitter so parallel workers don't retry in lockstep;
+    # the final response is returned instead of raised. 429 is left out so it
+    # reaches the token bucket, which slows every worker down instead of retrying.
     retry_strategy = Retry(
         total=CONFIG['max_retries'],
         backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],
+        backoff_jitter=0.5,
+        respect_retry_after_header=True,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=frozenset(['GET']),
+        raise_on_status=False,
+    )
+    # Keep a warm connection per worker; never block when the pool is exhausted
+    pool_size = max(CONFIG['concurrency'], 10)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=False
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     session.headers.update(HEADERS)
+    # Skip the proxy/netrc environment lookup done on every request
+    session.trust_env = CONFIG['trust_env']
     return session
 
+def retry_after_seconds(response):
+    """Seconds a rate-limited response asks us to wait"""
+    try:
+        wait = Retry(0).parse_retry_after(response.headers.get('Retry-After', ''))
+    except Exception:
+        wait = None
+    # A valid "0" or a date in the past means no wait, not the default
+    return CONFIG['rate_limit_wait'] if wait is None else wait
+
+# STEP 3a: Per-host pacing shared by all workers
+class TokenBucket:
+    """Thread-safe token bucket whose rate adapts to the server (AIMD)
+    
+    The rate is halved on every 429 and raised by a tenth of the ceiling after
+    each streak of successful fetches.
+    """
+    
+    def __init__(self, rate, burst, min_rate, increase_after):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.increase_after = increase_after
+        self.tokens = burst
+        self.successes = 0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+    
+    def record_success(self):
+        """Additive increase after a streak of successful fetches"""
+        with self.lock:
+            self.successes += 1
+            if self.successes >= self.increase_after and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+                self.successes = 0
+    
+    def record_throttled(self):
+        """Multiplicative decrease when the server rate limits us"""
+        with self.lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0)
+            self.successes = 0
+        logger.warning(f"Request rate lowered to {self.rate:.2f}/s")
+
+buckets = {}
+buckets_lock = threading.Lock()
+
+def get_bucket(url):
+    """Token bucket for the host of a URL"""
+    host = urlsplit(url).netloc
+    with buckets_lock:
+        if host not in buckets:
+            buckets[host] = TokenBucket(
+                CONFIG['requests_per_second'],
+                CONFIG['burst'],
+                CONFIG['min_requests_per_second'],
+                CONFIG['rate_increase_after']
+            )
+        return buckets[host]
+
+# STEP 3b: On-disk page cache so re-runs don't hit Zomato again
+def cache_path(url):
+    """Cache file for a page URL"""
+    key = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(CONFIG['cache_dir'], key + '.html')
+
+def read_cached_page(url):
+    """Return the cached page body, or None if missing or expired"""
+    path = cache_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) > CONFIG['cache_ttl']:
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+cache_lock = threading.Lock()
+cache_bytes = 0  # Approximate size of the cache directory, kept by prune_cache and writes
+
+def prune_cache():
+    """Evict expired pages, then the oldest ones until the cache is below 90% of its limit"""
+    global cache_bytes
+    now = time.time()
+    entries = []
+    try:
+        with os.scandir(CONFIG['cache_dir']) as it:
+            for entry in it:
+                try:
+                    stat = entry.stat()
+                    # Expired pages and temp files orphaned by a crash
+                    if entry.name.endswith('.tmp') or now - stat.st_mtime > CONFIG['cache_ttl']:
+                        os.remove(entry.path)
+                    else:
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        entries = []
+    
+    # Leave headroom so the next writes don't immediately trigger another full scan
+    low_water = CONFIG['cache_size_limit'] * 0.9
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= low_water:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            continue
+    cache_bytes = total
+
+def write_cached_page(url, content):
+    """Store a page body in the cache; a failed write is logged, never raised"""
+    global cache_bytes
+    path = cache_path(url)
+    # Write then rename so a concurrent reader never sees a partial page
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(CONFIG['cache_dir'], exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not cache {url}: {e}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return
+    
+    with cache_lock:
+        cache_bytes += len(content)
+        if cache_bytes > CONFIG['cache_size_limit']:
+            prune_cache()
+
 # STEP 4: Progress tracking functions
-def save_checkpoint(processed_urls, all_reviews):
+def save_checkpoint(processed_urls, total_reviews):
     """Save progress to checkpoint file"""
     checkpoint = {
-        'processed_urls': processed_urls,
-        'total_reviews': len(all_reviews),
+        'processed_urls': sorted(processed_urls),
+        'total_reviews': total_reviews,
         'timestamp': datetime.now().isoformat()
     }
-    with open(CONFIG['checkpoint_file'], 'w') as f:
-        json.dump(checkpoint, f)
-    logger.info(f"Checkpoint saved: {len(processed_urls)} URLs processed, {len(all_reviews)} reviews collected")
+    if orjson is not None:
+        content = orjson.dumps(checkpoint)
+    else:
+        content = json.dumps(checkpoint).encode('utf-8')
+    
+    # Write under a temporary name and rename, so an interrupt mid-write
+    # leaves the previous checkpoint intact
+    temp_path = f"{CONFIG['checkpoint_file']}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, CONFIG['checkpoint_file'])
+    logger.info(f"Checkpoint saved: {len(processed_urls)} URLs processed, {total_reviews} reviews collected")
 
 def load_checkpoint():
-    """Load progress from checkpoint file"""
+    """Load the set of processed URLs from checkpoint file"""
     if os.path.exists(CONFIG['checkpoint_file']):
-        with open(CONFIG['checkpoint_file'], 'r') as f:
-            checkpoint = json.load(f)
+        with open(CONFIG['checkpoint_file'], 'rb') as f:
+            content = f.read()
+        checkpoint = orjson.loads(content) if orjson is not None else json.loads(content)
         logger.info(f"Checkpoint loaded: {len(checkpoint['processed_urls'])} URLs already processed")
-        return checkpoint['processed_urls']
-    return []
+        return set(checkpoint['processed_urls'])
+    return set()
 
 # STEP 5: Enhanced review extraction with multiple selectors
-def extract_reviews(soup):
+# Compiled once at startup; invalid selectors fail here rather than per page
+COMPILED_SELECTORS = tuple(CSSSelector(selector) for selector in [
+    'p.sc-1hez2tp-0.sc-hfLElm.hreYiP',  # Current selector
+    'div[data-testid="review-text"]',    # Alternative selector
+    'div.reviews-text',                  # Another alternative
+    'p.review-text',                     # Generic fallback
+    'div.review-content p',              # Nested content
+    '[class*="review"] p',               # Class contains review
+])
+
+def extract_reviews(root):
     """Extract reviews using multiple CSS selectors as fallback"""
-    review_selectors = [
-        'p.sc-1hez2tp-0.sc-hfLElm.hreYiP',  # Current selector
-        'div[data-testid="review-text"]',    # Alternative selector
-        'div.reviews-text',                  # Another alternative
-        'p.review-text',                     # Generic fallback
-        'div.review-content p',              # Nested content
-        '[class*="review"] p',               # Class contains review
-    ]
+    for selector in COMPILED_SELECTORS:
+        review_blocks = selector(root)
+        if review_blocks:
+            break
+    else:
+        return []
     
     reviews = []
-    for selector in review_selectors:
-        try:
-            if '.' in selector and not selector.startswith('['):
-                # CSS class selector
-                review_blocks = soup.select(selector)
-            else:
-                # Other selector types
-                review_blocks = soup.select(selector)
-            
-            if review_blocks:
-                for block in review_blocks:
-                    text = block.get_text(strip=True)
-                    if text and len(text) > 20:  # Filter out very short text
-                        reviews.append(text)
-                logger.info(f"Found {len(review_blocks)} reviews using selector: {selector}")
-                break
-        except Exception as e:
-            logger.warning(f"Error with selector {selector}: {e}")
-            continue
+    for block in review_blocks:
+        text = block.text_content().strip()
+        if text and len(text) > 20:  # Filter out very short text
+            reviews.append(text)
+    logger.debug("Found %d reviews using selector: %s", len(review_blocks), selector.css)
     
     return reviews
 
-all_reviews = []
-processed_urls = load_checkpoint()
-session = create_session()
+# Column order of the review rows built by scrape_restaurant
+REVIEW_FIELDS = ['restaurant_url', 'page', 'review', 'scraped_at']
 
-# STEP 6: Main scraping loop with enhanced error handling
-for i, res_url in enumerate(urls):
-    # Skip if already processed
-    if res_url in processed_urls:
-        logger.info(f"Skipping already processed URL: {res_url}")
-        continue
-    
-    review_url = get_review_url(res_url)
-    logger.info(f"Processing {i+1}/{len(urls)}: {review_url}")
+# STEP 6: Scrape a single restaurant with enhanced error handling
+def scrape_restaurant(session, res_url):
+    """Scrape all review pages of one restaurant"""
+    page_urls = get_page_urls(res_url)
+    logger.debug("Processing %s", res_url)
     
     restaurant_reviews = []
     
     try:
-        for page in range(1, CONFIG['max_pages'] + 1):
-            full_url = f"{review_url}?page={page}"
-            
+        # Pages stay sequential: scraping stops at the first empty page
+        for page, full_url in enumerate(page_urls, 1):
             try:
-                # Random delay to be respectful
-                delay = random.uniform(*CONFIG['delay_range'])
-                time.sleep(delay)
-                
-                response = session.get(full_url, timeout=CONFIG['timeout'])
+                content = read_cached_page(full_url)
                 
-                if response.status_code != 200:
-                    logger.warning(f"Failed to fetch {full_url}, status code: {response.status_code}")
-                    break
+                if content is None:
+                    # Pace requests per host to be respectful
+                    bucket = get_bucket(full_url)
+                    bucket.acquire()
+                    
+                    response = session.get(full_url, timeout=CONFIG['timeout'])
+                    
+                    if response.status_code == 429:
+                        bucket.record_throttled()
+                        wait = retry_after_seconds(response)
+                        logger.warning(f"Rate limited on {full_url}, pausing {wait:.0f}s")
+                        time.sleep(wait)
+                        break
+                    
+                    if response.status_code != 200:
+                        logger.warning(f"Failed to fetch {full_url}, status code: {response.status_code}")
+                        break
+                    
+                    bucket.record_success()
+                    content = response.content
+                    write_cached_page(full_url, content)
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                page_reviews = extract_reviews(soup)
+                # Parse the raw bytes; lxml detects the encoding itself
+                root = lxml.html.fromstring(content)
+                page_reviews = extract_reviews(root)
                 
                 if not page_reviews:
-                    logger.info(f"No reviews found on page {page} for {res_url}")
+                    logger.debug("No reviews found on page %d for %s", page, res_url)
                     break
                 
-                # Add reviews with metadata
-                for review_text in page_reviews:
-                    restaurant_reviews.append({
-                        'restaurant_url': res_url,
-                        'page': page,
-                        'review': review_text,
-                        'scraped_at': datetime.now().isoformat()
-                    })
+                # Add reviews with metadata as REVIEW_FIELDS rows; the URL and
+                # timestamp strings are shared by every row rather than copied
+                scraped_at = datetime.now().isoformat()
+                restaurant_reviews.extend(
+                    (res_url, page, review_text, scraped_at) for review_text in page_reviews
+                )
                 
-                logger.info(f"Extracted {len(page_reviews)} reviews from page {page}")
+                logger.debug("Extracted %d reviews from page %d of %s", len(page_reviews), page, res_url)
                 
             except requests.exceptions.Timeout:
                 logger.error(f"Timeout for {full_url}")
@@ -191,50 +399,105 @@ for i, res_url in enumerate(urls):
     
     except Exception as e:
         logger.error(f"Error processing restaurant {res_url}: {e}")
-        continue
     
-    # Add restaurant reviews to main list
-    all_reviews.extend(restaurant_reviews)
-    processed_urls.append(res_url)
+    return restaurant_reviews
+
+# The scrape itself only runs as a script, so the helpers above can be imported
+if __name__ == "__main__":
+    # STEP 1: Read CSV with error handling
+    try:
+        df = pd.read_csv(CONFIG['input_file'])
+        # Normalize trailing slashes so a restaurant listed twice is scraped once;
+        # dict.fromkeys keeps the input order
+        urls = list(dict.fromkeys(url.rstrip('/') for url in df['url'].dropna()))
+        logger.info(f"Successfully loaded {len(urls)} unique URLs from {CONFIG['input_file']}")
+    except Exception as e:
+        logger.error(f"Error reading CSV file: {e}")
+        raise
     
-    logger.info(f"Completed {res_url}: {len(restaurant_reviews)} reviews collected")
+    processed_urls = load_checkpoint()
+    session = create_session()
+    prune_cache()
     
-    # Save checkpoint periodically
-    if (i + 1) % CONFIG['chunk_size'] == 0:
-        save_checkpoint(processed_urls, all_reviews)
-        
-        # Save intermediate results
-        if all_reviews:
-            temp_df = pd.DataFrame(all_reviews)
-            temp_df.to_csv(f"temp_{CONFIG['output_file']}", index=False)
-            logger.info(f"Saved intermediate results: {len(all_reviews)} reviews")
-
-# STEP 7: Final save and cleanup
-logger.info("Scraping completed. Saving final results...")
-save_checkpoint(processed_urls, all_reviews)
-
-if all_reviews:
-    result_df = pd.DataFrame(all_reviews)
-    result_df.to_csv(CONFIG['output_file'], index=False)
-    logger.info(f"✅ Scraping completed! {len(all_reviews)} reviews saved to {CONFIG['output_file']}")
-    
-    # Clean up temporary files
+    # Reviews are streamed to the temp file per restaurant; only counts stay in memory
     temp_file = f"temp_{CONFIG['output_file']}"
-    if os.path.exists(temp_file):
-        os.remove(temp_file)
-else:
-    logger.warning("No reviews were collected!")
-
-# STEP 8: Summary statistics
-if all_reviews:
-    unique_restaurants = len(set(review['restaurant_url'] for review in all_reviews))
-    avg_reviews_per_restaurant = len(all_reviews) / unique_restaurants if unique_restaurants > 0 else 0
-    
-    logger.info(f"""
-    Scraping Summary:
-    - Total restaurants processed: {len(processed_urls)}
-    - Total reviews collected: {len(all_reviews)}
-    - Unique restaurants with reviews: {unique_restaurants}
-    - Average reviews per restaurant: {avg_reviews_per_restaurant:.2f}
-    - Output file: {CONFIG['output_file']}
-    """)
+    total_reviews = 0
+    reviewed_urls = set()
+    # A finished run renames or removes the temp file, so one left behind belongs to an
+    # interrupted run. Resume from it: its restaurants were completed even if the crash
+    # came before their checkpoint (or before the first checkpoint at all).
+    if os.path.exists(temp_file) and os.path.getsize(temp_file) > 0:
+        saved_urls = pd.read_csv(temp_file, usecols=['restaurant_url'])['restaurant_url']
+        total_reviews = len(saved_urls)
+        reviewed_urls.update(saved_urls.unique())
+        processed_urls.update(reviewed_urls)
+        logger.info(f"Recovered {total_reviews} reviews from {temp_file}")
+    
+    # Only restaurants not finished by an earlier run are scraped
+    pending = [res_url for res_url in urls if res_url not in processed_urls]
+    logger.info(f"{len(urls) - len(pending)} restaurants already done, {len(pending)} remaining")
+    
+    # STEP 7: Main scraping loop, several restaurants at a time
+    with open(temp_file, 'a', newline='', encoding='utf-8') as temp_out, \
+            ThreadPoolExecutor(max_workers=CONFIG['concurrency']) as executor:
+        writer = csv.writer(temp_out)
+        if temp_out.tell() == 0:
+            writer.writerow(REVIEW_FIELDS)
+        
+        futures = {executor.submit(scrape_restaurant, session, res_url): res_url for res_url in pending}
+        
+        try:
+            for completed, future in enumerate(as_completed(futures), 1):
+                res_url = futures[future]
+                restaurant_reviews = future.result()
+                
+                # Append this restaurant's reviews to disk and keep only the counts
+                if restaurant_reviews:
+                    writer.writerows(restaurant_reviews)
+                    temp_out.flush()
+                    total_reviews += len(restaurant_reviews)
+                    reviewed_urls.add(res_url)
+                processed_urls.add(res_url)
+                
+                logger.info(f"Completed {completed}/{len(futures)} {res_url}: {len(restaurant_reviews)} reviews collected")
+                
+                # Save checkpoint periodically
+                if completed % CONFIG['chunk_size'] == 0:
+                    save_checkpoint(processed_urls, total_reviews)
+        except BaseException:
+            # On Ctrl-C (or any error) drop the queued restaurants instead of letting the
+            # pool scrape them only to discard the results; workers already running
+            # finish their current restaurant
+            executor.shutdown(wait=False, cancel_futures=True)
+            save_checkpoint(processed_urls, total_reviews)
+            logger.warning(f"Scraping interrupted after {len(processed_urls)} restaurants; rerun to resume")
+            raise
+    
+    # STEP 8: Final save and cleanup
+    logger.info("Scraping completed. Saving final results...")
+    save_checkpoint(processed_urls, total_reviews)
+    
+    if total_reviews:
+        # The temp file already holds every review, including those from resumed runs
+        os.replace(temp_file, CONFIG['output_file'])
+        logger.info(f"✅ Scraping completed! {total_reviews} reviews saved to {CONFIG['output_file']}")
+    else:
+        logger.warning("No reviews were collected!")
+        
+        # Only a header was written
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+    
+    # STEP 9: Summary statistics
+    if total_reviews:
+        unique_restaurants = len(reviewed_urls)
+        avg_reviews_per_restaurant = total_reviews / unique_restaurants if unique_restaurants > 0 else 0
+        
+        logger.info(f"""
+        Scraping Summary:
+        - Total restaurants processed: {len(processed_urls)}
+        - Total reviews collected: {total_reviews}
+        - Unique restaurants with reviews: {unique_restaurants}
+        - Average reviews per restaurant: {avg_reviews_per_restaurant:.2f}
+        - Output file: {CONFIG['output_file']}
+        """)
@@ -47,6 +47,14 @@ def test_data_processor():
         unique_reviews = processor.deduplicate_reviews(test_reviews)
         print(f"✅ Deduplication test passed: {len(unique_reviews)}/4 reviews unique")
         
+        # Test the fused pipeline against the two separate steps
+        processed_reviews = processor.process_reviews(test_reviews, min_length=10)
+        expected = processor.deduplicate_reviews(processor.validate_reviews(test_reviews, min_length=10))
+        if processed_reviews != expected or len(processed_reviews) != 2:
+            print(f"❌ Processing test failed: {processed_reviews} != {expected}")
+            return False
+        print(f"✅ Processing test passed: {len(processed_reviews)}/4 reviews kept")
+        
         # Test stats generation
         stats = processor.generate_summary_stats(test_reviews)
         print(f"✅ Stats generation test passed: {len(stats)} stats generated")
@@ -68,19 +76,35 @@ def test_checkpoint_manager():
         test_urls = ['url1', 'url2', 'url3']
         test_reviews = [{'review': 'test', 'restaurant_url': 'url1'}]
         
-        checkpoint.save_checkpoint(test_urls, test_reviews)
+        checkpoint.save_checkpoint(test_urls, len(test_reviews))
         loaded_urls = checkpoint.load_checkpoint()
         
-        if loaded_urls == test_urls:
-            print("✅ Checkpoint save/load test passed")
-            
-            # Clean up
-            checkpoint.clear_checkpoint()
-            print("✅ Checkpoint cleanup test passed")
-            return True
-        else:
+        if loaded_urls != set(test_urls):
             print("❌ Checkpoint test failed: loaded data doesn't match")
             return False
+        print("✅ Checkpoint save/load test passed")
+        
+        # Test the progress log: marked URLs load before the next full save,
+        # and a full save folds them into the checkpoint
+        checkpoint.mark_processed(['url4', 'url5'])
+        loaded_urls = checkpoint.load_checkpoint()
+        if loaded_urls != set(test_urls) | {'url4', 'url5'}:
+            print("❌ Progress log test failed: marked URLs not loaded")
+            return False
+        
+        checkpoint.save_checkpoint(loaded_urls, len(test_reviews))
+        if os.path.exists(checkpoint.progress_file) or os.path.exists('test_checkpoint.json.tmp'):
+            print("❌ Progress log test failed: leftover files after save")
+            return False
+        if checkpoint.load_checkpoint() != loaded_urls:
+            print("❌ Progress log test failed: merged checkpoint doesn't match")
+            return False
+        print("✅ Checkpoint progress log test passed")
+        
+        # Clean up
+        checkpoint.clear_checkpoint()
+        print("✅ Checkpoint cleanup test passed")
+        return True
             
     except Exception as e:
         print(f"❌ CheckpointManager test failed: {e}")
@@ -109,6 +133,92 @@ def test_scraper_initialization():
         print(f"❌ Scraper initialization test failed: {e}")
         return False
 
+def test_fast_review_extraction():
+    """Test the byte-level review extractor against the full parser"""
+    try:
+        import lxml.html
+        from enhanced_scraper import ZomatoReviewScraper
+        
+        scraper = ZomatoReviewScraper()
+        classes = 'sc-1hez2tp-0 sc-hfLElm hreYiP'
+        
+        # (name, page body, whether the fast path should handle it)
+        cases = [
+            ('plain', f'<p class="{classes}">Great food and friendly staff</p>', True),
+            ('reordered attributes', f'<p data-id="7" class="{classes}" id="r1">Great food and friendly staff</p>', True),
+            ('reordered classes', '<p class="hreYiP sc-1hez2tp-0 sc-hfLElm">Great food and friendly staff</p>', True),
+            ('single quotes', f"<p class='{classes}'>Great food and friendly staff</p>", True),
+            ('entities', f'<p class="{classes}">Fish &amp; chips, &quot;best&quot; in town &#8211; 5&#9733;</p>', True),
+            ('partial class list', '<p class="sc-1hez2tp-0 hreYiP">Great food and friendly staff</p>', False),
+            ('nested markup', f'<p class="{classes}">Great <b>food</b> and friendly staff</p>', False),
+            ('mixed blocks', f'<p class="{classes}">Great food and friendly staff</p>'
+                             f'<p class="{classes}">Slow <i>service</i> but tasty dishes</p>', False),
+        ]
+        
+        for name, body, fast_expected in cases:
+            content = f'<html><body><div>{body}</div></body></html>'.encode('utf-8')
+            fast = scraper._extract_reviews_fast(content)
+            full, _ = scraper._extract_reviews(lxml.html.fromstring(content))
+            
+            # The fast path must either agree with the full parser or defer to it
+            if fast != full and fast != []:
+                print(f"❌ Fast extraction test failed ({name}): {fast} != {full}")
+                return False
+            if fast_expected and not fast:
+                print(f"❌ Fast extraction test failed ({name}): fell back unexpectedly")
+                return False
+        
+        print(f"✅ Fast extraction test passed: {len(cases)} cases match the full parser")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Fast extraction test failed: {e}")
+        return False
+
+def test_js_parser():
+    """Test the preloaded-state extraction in the JavaScript parser"""
+    try:
+        import json
+        from javascript_parser import ZomatoJSParser
+        
+        parser = ZomatoJSParser()
+        
+        # An escaped quote is skipped; a quote after an escaped backslash closes the string
+        if parser._find_string_end(r'ab\"cd"', 0) != 6 or parser._find_string_end(r'ab\\"cd"', 0) != 4:
+            print("❌ JS parser test failed: wrong string end around backslashes")
+            return False
+        print("✅ String end test passed")
+        
+        # Synthetic payload whose review text holds quotes and backslashes, one of
+        # them right before the closing quote of the JSON string
+        text = 'He said "best biryani" \\ and the path was C:\\'
+        state = {'entities': {'REVIEWS': {'1': {'status': 'success', 'reviewId': 1, 'reviewText': text}}}}
+        literal = json.dumps(json.dumps(state))[1:-1]
+        page = f'<script>window.__PRELOADED_STATE__ = JSON.parse("{literal}");</script>'
+        
+        if parser._extract_preloaded_state(page) != literal:
+            print("❌ JS parser test failed: preloaded state literal cut short")
+            return False
+        reviews = parser.extract_reviews_from_js(page)
+        if [review['review_text'] for review in reviews] != [text]:
+            print(f"❌ JS parser test failed: {reviews}")
+            return False
+        print("✅ Escaped payload test passed")
+        
+        # The saved page carries three reviews in its preloaded state
+        debug_page = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'debug_page.html')
+        with open(debug_page, 'r', encoding='utf-8') as f:
+            reviews = parser.extract_reviews_from_js(f.read())
+        if len(reviews) != 3:
+            print(f"❌ JS parser test failed: {len(reviews)} reviews found in debug page, expected 3")
+            return False
+        print("✅ Debug page test passed: 3 reviews found")
+        return True
+        
+    except Exception as e:
+        print(f"❌ JS parser test failed: {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("Running enhanced scraper tests...")
@@ -118,7 +228,9 @@ def main():
         test_imports,
         test_data_processor,
         test_checkpoint_manager,
-        test_scraper_initialization
+        test_scraper_initialization,
+        test_fast_review_extraction,
+        test_js_parser
     ]
     
     passed = 0
@@ -1,12 +1,49 @@
 import pandas as pd
 import json
+import re
 import os
 import logging
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Set, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Reviews may be passed around as a list of dicts or as a DataFrame
+Reviews = Union[List[Dict[str, Any]], pd.DataFrame]
+
+# Rating labels that leak into review text, and whitespace runs to collapse
+_CLEAN_RE = re.compile(r'RATED\n|Rated\s')
+_WS_RE = re.compile(r'\s+')
+
+def _write_json(data: Any, path: str) -> None:
+    """Write indented JSON, using orjson when it is installed
+    
+    The file is written under a temporary name and renamed into place, so a
+    crash mid-write leaves the previous version intact.
+    """
+    if orjson is not None:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        content = json.dumps(data, indent=2).encode('utf-8')
+    
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+def _read_json(path: str) -> Any:
+    """Read JSON, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
 class DataProcessor:
     """Utility class for data processing and analysis"""
     
@@ -16,107 +53,125 @@ class DataProcessor:
         if not text:
             return ""
         
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        # Remove common patterns that aren't useful
-        patterns_to_remove = [
-            'RATED\n',
-            'Rated ',
-            '\n',
-            '\r',
-            '\t'
-        ]
+        return _WS_RE.sub(' ', _CLEAN_RE.sub(' ', text)).strip()
+    
+    @staticmethod
+    def clean_review_series(reviews: pd.Series) -> pd.Series:
+        """Vectorized clean_review_text for a column of review text"""
+        # Compiled patterns keep Python's Unicode-aware \s on every string backend
+        return (reviews.str.replace(_CLEAN_RE, ' ', regex=True)
+                       .str.replace(_WS_RE, ' ', regex=True)
+                       .str.strip())
+    
+    @staticmethod
+    def _review_text(df: pd.DataFrame) -> pd.Series:
+        """Review column as stripped strings, with missing reviews as empty text"""
+        return df['review'].fillna('').astype(str).str.strip()
+    
+    @staticmethod
+    def _quality_mask(review_text: pd.Series, min_length: int) -> pd.Series:
+        """Rows long enough that contain actual letters, not just whitespace,
+        digits or punctuation"""
+        # [^\W\d_] is any Unicode letter; re.UNICODE keeps that true for
+        # Arrow-backed strings, whose regex engine treats \W as ASCII-only
+        has_letters = review_text.str.contains(r'[^\W\d_]', regex=True, flags=re.UNICODE)
+        return (review_text.str.len() >= min_length) & has_letters
+    
+    @staticmethod
+    def _drop_duplicate_reviews(df: pd.DataFrame) -> pd.DataFrame:
+        """Keep the first occurrence of each (stripped) review, then clean the text"""
+        unique = df.drop_duplicates(subset='review', keep='first')
+        return unique.assign(review=DataProcessor.clean_review_series(unique['review']))
+    
+    @staticmethod
+    def deduplicate_reviews(reviews: Reviews) -> Reviews:
+        """Remove duplicate reviews based on text content
+        
+        Accepts a list of review dicts or a DataFrame and returns the same type.
+        """
+        is_frame = isinstance(reviews, pd.DataFrame)
+        df = reviews if is_frame else pd.DataFrame(reviews)
+        if df.empty:
+            return reviews
+        
+        review_text = DataProcessor._review_text(df)
+        unique = df.assign(review=review_text)[review_text.str.len() > 0]
+        unique = DataProcessor._drop_duplicate_reviews(unique)
+        
+        logger.info(f"Removed {len(df) - len(unique)} duplicate reviews")
+        return unique if is_frame else unique.to_dict('records')
+    
+    @staticmethod
+    def validate_reviews(reviews: Reviews, min_length: int = 20) -> Reviews:
+        """Validate and filter reviews based on quality criteria
         
-        for pattern in patterns_to_remove:
-            text = text.replace(pattern, ' ')
+        Accepts a list of review dicts or a DataFrame and returns the same type.
+        """
+        is_frame = isinstance(reviews, pd.DataFrame)
+        df = reviews if is_frame else pd.DataFrame(reviews)
+        if df.empty:
+            return reviews
         
-        # Remove extra spaces again
-        text = ' '.join(text.split())
+        valid = df[DataProcessor._quality_mask(DataProcessor._review_text(df), min_length)]
         
-        return text.strip()
-    
-    @staticmethod
-    def deduplicate_reviews(reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate reviews based on text content"""
-        seen_reviews = set()
-        unique_reviews = []
-        
-        for review in reviews:
-            review_text = review.get('review', '').strip()
-            if review_text and review_text not in seen_reviews:
-                seen_reviews.add(review_text)
-                # Clean the review text
-                review['review'] = DataProcessor.clean_review_text(review_text)
-                unique_reviews.append(review)
-        
-        logger.info(f"Removed {len(reviews) - len(unique_reviews)} duplicate reviews")
-        return unique_reviews
+        logger.info(f"Filtered {len(df) - len(valid)} invalid reviews")
+        return valid if is_frame else valid.to_dict('records')
     
     @staticmethod
-    def validate_reviews(reviews: List[Dict[str, Any]], min_length: int = 20) -> List[Dict[str, Any]]:
-        """Validate and filter reviews based on quality criteria"""
-        valid_reviews = []
-        
-        for review in reviews:
-            review_text = review.get('review', '').strip()
-            
-            # Check minimum length
-            if len(review_text) < min_length:
-                continue
-            
-            # Check if it's not just whitespace or special characters
-            if not review_text.replace(' ', '').replace('\n', '').replace('\t', ''):
-                continue
-            
-            # Check if it contains actual words (not just punctuation)
-            if not any(c.isalpha() for c in review_text):
-                continue
-            
-            valid_reviews.append(review)
-        
-        logger.info(f"Filtered {len(reviews) - len(valid_reviews)} invalid reviews")
-        return valid_reviews
+    def process_reviews(reviews: Reviews, min_length: int = 20) -> Reviews:
+        """validate_reviews followed by deduplicate_reviews, stripping the text once"""
+        is_frame = isinstance(reviews, pd.DataFrame)
+        df = reviews if is_frame else pd.DataFrame(reviews)
+        if df.empty:
+            return reviews
+        
+        review_text = DataProcessor._review_text(df)
+        mask = DataProcessor._quality_mask(review_text, min_length)
+        valid = df[mask].assign(review=review_text[mask])
+        processed = DataProcessor._drop_duplicate_reviews(valid)
+        
+        logger.info(f"Filtered {len(df) - len(valid)} invalid reviews and removed {len(valid) - len(processed)} duplicate reviews")
+        return processed if is_frame else processed.to_dict('records')
     
     @staticmethod
-    def generate_summary_stats(reviews: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def generate_summary_stats(reviews: Reviews) -> Dict[str, Any]:
         """Generate summary statistics for scraped reviews"""
-        if not reviews:
+        if len(reviews) == 0:
             return {}
         
-        # Count reviews per restaurant
-        restaurant_counts = {}
-        for review in reviews:
-            url = review.get('restaurant_url', '')
-            restaurant_counts[url] = restaurant_counts.get(url, 0) + 1
+        df = reviews if isinstance(reviews, pd.DataFrame) else pd.DataFrame(reviews)
         
-        # Calculate statistics
-        total_restaurants = len(restaurant_counts)
-        total_reviews = len(reviews)
-        avg_reviews_per_restaurant = total_reviews / total_restaurants if total_restaurants > 0 else 0
+        # Count reviews per restaurant, in order of first appearance
+        urls = df['restaurant_url'] if 'restaurant_url' in df else pd.Series('', index=df.index)
+        restaurant_counts = urls.groupby(urls, sort=False, observed=True, dropna=False).size()
         
         # Review length statistics
-        review_lengths = [len(review.get('review', '')) for review in reviews]
-        avg_review_length = sum(review_lengths) / len(review_lengths) if review_lengths else 0
+        review_text = df['review'] if 'review' in df else pd.Series('', index=df.index)
+        review_lengths = review_text.fillna('').astype(str).str.len()
+        
+        # Calculate statistics; cast to plain Python types so they serialize as JSON
+        total_restaurants = int(restaurant_counts.size)
+        total_reviews = len(df)
         
         return {
             'total_restaurants': total_restaurants,
             'total_reviews': total_reviews,
-            'avg_reviews_per_restaurant': round(avg_reviews_per_restaurant, 2),
-            'avg_review_length': round(avg_review_length, 2),
-            'min_review_length': min(review_lengths) if review_lengths else 0,
-            'max_review_length': max(review_lengths) if review_lengths else 0,
-            'restaurants_with_most_reviews': max(restaurant_counts.items(), key=lambda x: x[1]) if restaurant_counts else None
+            'avg_reviews_per_restaurant': round(total_reviews / total_restaurants, 2),
+            'avg_review_length': round(float(review_lengths.mean()), 2),
+            'min_review_length': int(review_lengths.min()),
+            'max_review_length': int(review_lengths.max()),
+            'restaurants_with_most_reviews': (restaurant_counts.idxmax(), int(restaurant_counts.max()))
         }
     
     @staticmethod
-    def save_processed_data(reviews: List[Dict[str, Any]], output_file: str) -> None:
+    def save_processed_data(reviews: Reviews, output_file: str) -> None:
         """Save processed reviews to CSV with additional metadata"""
-        if not reviews:
+        if len(reviews) == 0:
             logger.warning("No reviews to save")
             return
         
-        df = pd.DataFrame(reviews)
+        # Copy so the metadata columns don't leak into the caller's DataFrame
+        df = reviews.copy() if isinstance(reviews, pd.DataFrame) else pd.DataFrame(reviews)
         
         # Add processing metadata
         df['processed_at'] = datetime.now().isoformat()
@@ -127,10 +182,9 @@ class DataProcessor:
         logger.info(f"Saved {len(reviews)} processed reviews to {output_file}")
         
         # Save summary statistics
-        stats = DataProcessor.generate_summary_stats(reviews)
+        stats = DataProcessor.generate_summary_stats(df)
         stats_file = output_file.replace('.csv', '_stats.json')
-        with open(stats_file, 'w') as f:
-            json.dump(stats, f, indent=2)
+        _write_json(stats, stats_file)
         logger.info(f"Saved summary statistics to {stats_file}")
 
 class CheckpointManager:
@@ -138,38 +192,56 @@ class CheckpointManager:
     
     def __init__(self, checkpoint_file: str):
         self.checkpoint_file = checkpoint_file
+        # Append-only log of URLs completed since the last full checkpoint
+        self.progress_file = os.path.splitext(checkpoint_file)[0] + '_urls.txt'
     
-    def save_checkpoint(self, processed_urls: List[str], all_reviews: List[Dict[str, Any]]) -> None:
-        """Save progress to checkpoint file"""
+    def mark_processed(self, urls: Iterable[str]) -> None:
+        """Append newly completed URLs to the progress log"""
+        with open(self.progress_file, 'a', encoding='utf-8') as f:
+            f.writelines(url + '\n' for url in urls)
+            f.flush()
+    
+    def save_checkpoint(self, processed_urls: Iterable[str], total_reviews: int,
+                        last_processed: Optional[str] = None) -> None:
+        """Save full progress to checkpoint file and reset the progress log"""
+        processed_urls = sorted(processed_urls)
         checkpoint = {
             'processed_urls': processed_urls,
-            'total_reviews': len(all_reviews),
+            'total_reviews': total_reviews,
             'timestamp': datetime.now().isoformat(),
-            'last_processed': processed_urls[-1] if processed_urls else None
+            'last_processed': last_processed
         }
         
-        with open(self.checkpoint_file, 'w') as f:
-            json.dump(checkpoint, f, indent=2)
+        _write_json(checkpoint, self.checkpoint_file)
         
-        logger.info(f"Checkpoint saved: {len(processed_urls)} URLs processed, {len(all_reviews)} reviews collected")
+        # Everything in the progress log is now part of the checkpoint
+        if os.path.exists(self.progress_file):
+            os.remove(self.progress_file)
+        
+        logger.info(f"Checkpoint saved: {len(processed_urls)} URLs processed, {total_reviews} reviews collected")
     
-    def load_checkpoint(self) -> List[str]:
-        """Load progress from checkpoint file"""
+    def load_checkpoint(self) -> Set[str]:
+        """Load the set of already processed URLs from checkpoint and progress log"""
+        processed_urls = set()
+        
         if os.path.exists(self.checkpoint_file):
             try:
-                with open(self.checkpoint_file, 'r') as f:
-                    checkpoint = json.load(f)
-                
-                processed_urls = checkpoint.get('processed_urls', [])
-                logger.info(f"Checkpoint loaded: {len(processed_urls)} URLs already processed")
-                return processed_urls
+                checkpoint = _read_json(self.checkpoint_file)
+                processed_urls.update(checkpoint.get('processed_urls', []))
             except Exception as e:
                 logger.error(f"Error loading checkpoint: {e}")
-                return []
-        return []
+        
+        if os.path.exists(self.progress_file):
+            with open(self.progress_file, 'r', encoding='utf-8') as f:
+                processed_urls.update(line.rstrip('\n') for line in f if line.strip())
+        
+        if processed_urls:
+            logger.info(f"Checkpoint loaded: {len(processed_urls)} URLs already processed")
+        return processed_urls
     
     def clear_checkpoint(self) -> None:
-        """Clear the checkpoint file"""
-        if os.path.exists(self.checkpoint_file):
-            os.remove(self.checkpoint_file)
-            logger.info("Checkpoint cleared")
+        """Clear the checkpoint file and progress log"""
+        for path in (self.checkpoint_file, self.progress_file):
+            if os.path.exists(path):
+                os.remove(path)
+                logger.info(f"Checkpoint cleared: {path}")